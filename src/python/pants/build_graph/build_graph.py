@@ -171,7 +171,9 @@ class BuildGraph(AbstractClass):
       'Cannot retrieve dependents of {address} because it is not in the BuildGraph.'
       .format(address=address)
     )
-    return self._target_dependees_by_address[address]
+    # NB: Avoid allocating (and retaining) an empty set via the defaultdict for every target that
+    # nothing depends on.
+    return self._target_dependees_by_address.get(address, frozenset())
 
   def get_derived_from(self, address):
     """Get the target the specified target was derived from.
@@ -370,7 +372,7 @@ class BuildGraph(AbstractClass):
         if not predicate or predicate(target):
           if not postorder:
             work(target)
-          for dep_address in self._target_dependees_by_address[addr]:
+          for dep_address in self._target_dependees_by_address.get(addr, ()):
             _walk_rec(dep_address)
           if postorder:
             work(target)
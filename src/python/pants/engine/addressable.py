@@ -391,7 +391,9 @@ class AddressableList(AddressableDescriptor):
     if value is None:
       return None
 
-    if not isinstance(value, collections.MutableSequence):
+    # NB: A concrete type check first, since ABC isinstance checks are comparatively slow and this
+    # is called at least once per parsed target.
+    if type(value) is not list and not isinstance(value, collections.MutableSequence):
       raise TypeError('The {} property of {} must be a list, given {} of type {}'
                       .format(self._name, instance, value, type(value).__name__))
     return [super(AddressableList, self)._checked_value(instance, v) for v in value]
@@ -8,6 +8,7 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 import itertools
 import logging
 
+from six.moves import zip
 from twitter.common.collections import OrderedSet
 
 from pants.backend.jvm.targets.jvm_app import Bundle, JvmApp
@@ -79,23 +80,29 @@ class LegacyBuildGraph(BuildGraph):
       target_types[alias] = target_type
     return target_types
 
-  def _index(self, roots):
-    """Index from the given roots into the storage provided by the base class.
+  def _index(self, products):
+    """Index from the given HydratedTargets products into the storage provided by the base class.
+
+    `products` may be any iterable: it is consumed exactly once.
 
     This is an additive operation: any existing connections involving these nodes are preserved.
     """
     all_addresses = set()
     new_targets = list()
 
+    # NB: Bound to locals, since the loop below runs once per target in the closure.
+    target_by_address = self._target_by_address
+    index_target = self._index_target
+
     # Index the ProductGraph.
-    for product in roots.values():
+    for product in products:
       # We have a successful HydratedTargets value (for a particular input Spec).
       for hydrated_target in product.dependencies:
         target_adaptor = hydrated_target.adaptor
         address = target_adaptor.address
         all_addresses.add(address)
-        if address not in self._target_by_address:
-          new_targets.append(self._index_target(target_adaptor))
+        if address not in target_by_address:
+          new_targets.append(index_target(target_adaptor))
 
     # Once the declared dependencies of all targets are indexed, inject their
     # additional "traversable_(dependency_)?specs".
@@ -139,16 +146,19 @@ class LegacyBuildGraph(BuildGraph):
     target = self._instantiate_target(target_adaptor)
     self._target_by_address[address] = target
 
+    # NB: The dependencies set for this address is looked up once rather than once per edge.
+    dependencies = self._target_dependencies_by_address[address]
+    dependees_by_address = self._target_dependees_by_address
     for dependency in target_adaptor.dependencies:
-      if dependency in self._target_dependencies_by_address[address]:
+      if dependency in dependencies:
         raise self.DuplicateAddressError(
           'Addresses in dependencies must be unique. '
           "'{spec}' is referenced more than once by target '{target}'."
           .format(spec=dependency.spec, target=address.spec)
         )
       # Link its declared dependencies, which will be indexed independently.
-      self._target_dependencies_by_address[address].add(dependency)
-      self._target_dependees_by_address[dependency].add(address)
+      dependencies.add(dependency)
+      dependees_by_address[dependency].add(address)
     return target
 
   def _instantiate_target(self, target_adaptor):
@@ -248,13 +258,10 @@ class LegacyBuildGraph(BuildGraph):
       )
 
     # Update the base class indexes for this request.
-    address_entries = dict(zip(subjects, product_results[BuildFileAddresses]))
-    target_entries = dict(zip(subjects, product_results[HydratedTargets]))
-
-    self._index(target_entries)
+    self._index(product_results[HydratedTargets])
 
     yielded_addresses = set()
-    for subject, product in address_entries.items():
+    for subject, product in zip(subjects, product_results[BuildFileAddresses]):
       if not product.dependencies:
         raise self.InvalidCommandLineSpecError(
           'Spec {} does not match any targets.'.format(subject))
@@ -264,13 +271,20 @@ class LegacyBuildGraph(BuildGraph):
           yield address
 
 
-class HydratedTarget(datatype('HydratedTarget', ['address', 'adaptor', 'dependencies'])):
+class HydratedTarget(object):
   """A wrapper for a fully hydrated TargetAdaptor object.
 
   Transitive graph walks collect ordered sets of HydratedTargets which involve a huge amount
   of hashing: we implement eq/hash via direct usage of an Address field to speed that up.
   """
 
+  __slots__ = ('address', 'adaptor', 'dependencies')
+
+  def __init__(self, address, adaptor, dependencies):
+    self.address = address
+    self.adaptor = adaptor
+    self.dependencies = dependencies
+
   @property
   def addresses(self):
     return self.dependencies
@@ -286,6 +300,10 @@ class HydratedTarget(datatype('HydratedTarget', ['address', 'adaptor', 'dependen
   def __hash__(self):
     return hash(self.address)
 
+  def __repr__(self):
+    return ('HydratedTarget(address={!r}, adaptor={!r}, dependencies={!r})'
+            .format(self.address, self.adaptor, self.dependencies))
+
 
 HydratedTargets = Collection.of(HydratedTarget)
 
@@ -18,9 +18,7 @@ from pants.engine.objects import Locatable
 from pants.engine.struct import Struct, StructWithDeps
 from pants.source import wrapped_globs
 from pants.util.contextutil import exception_logging
-from pants.util.memo import memoized_method
 from pants.util.meta import AbstractClass
-from pants.util.objects import datatype
 
 
 logger = logging.getLogger(__name__)
@@ -58,14 +56,27 @@ class TargetAdaptor(StructWithDeps):
 
   @property
   def field_adaptors(self):
-    """Returns a tuple of Fields for captured fields which need additional treatment."""
-    with exception_logging(logger, 'Exception in `field_adaptors` property'):
-      sources = self.get_sources()
-      if not sources:
-        return tuple()
-      base_globs = BaseGlobs.from_sources_field(sources, self.address.spec_path)
-      path_globs = base_globs.to_path_globs(self.address.spec_path)
-      return (SourcesField(self.address, 'sources', base_globs.filespecs, path_globs),)
+    """Returns a tuple of Fields for captured fields which need additional treatment.
+
+    The tuple is computed on first access and then cached on this instance.
+    """
+    # NB: Struct fields live in `_kwargs`, so caching in the instance `__dict__` does not affect
+    # `kwargs()` or equality.
+    field_adaptors = self.__dict__.get('_field_adaptors')
+    if field_adaptors is None:
+      with exception_logging(logger, 'Exception in `field_adaptors` property'):
+        field_adaptors = self._compute_field_adaptors()
+      self._field_adaptors = field_adaptors
+    return field_adaptors
+
+  def _compute_field_adaptors(self):
+    """Computes the value of `field_adaptors`: subclasses may override to add further Fields."""
+    sources = self.get_sources()
+    if not sources:
+      return tuple()
+    base_globs = BaseGlobs.from_sources_field(sources, self.address.spec_path)
+    path_globs = base_globs.to_path_globs(self.address.spec_path)
+    return (SourcesField(self.address, 'sources', base_globs.filespecs, path_globs),)
 
   @property
   def default_sources(self):
@@ -84,8 +95,10 @@ class TargetAdaptor(StructWithDeps):
 class Field(object):
   """A marker for Target(Adaptor) fields for which the engine might perform extra construction."""
 
+  __slots__ = ()
+
 
-class SourcesField(datatype('SourcesField', ['address', 'arg', 'filespecs', 'path_globs']), Field):
+class SourcesField(Field):
   """Represents the `sources` argument for a particular Target.
 
   Sources are currently eagerly computed in-engine in order to provide the `BuildGraph`
@@ -100,6 +113,16 @@ class SourcesField(datatype('SourcesField', ['address', 'arg', 'filespecs', 'pat
   :param path_globs: A PathGlobs describing included files.
   """
 
+  # NB: Equality and hashing only consider the address (and arg), so the remaining fields are
+  # stored in slots rather than in a tuple.
+  __slots__ = ('address', 'arg', 'filespecs', 'path_globs')
+
+  def __init__(self, address, arg, filespecs, path_globs):
+    self.address = address
+    self.arg = arg
+    self.filespecs = filespecs
+    self.path_globs = path_globs
+
   def __eq__(self, other):
     return type(self) == type(other) and self.address == other.address and self.arg == other.arg
 
@@ -145,9 +168,17 @@ class JunitTestsAdaptor(TargetAdaptor):
     return self.java_test_globs + self.scala_test_globs
 
 
-class BundlesField(datatype('BundlesField', ['address', 'bundles', 'filespecs_list', 'path_globs_list']), Field):
+class BundlesField(Field):
   """Represents the `bundles` argument, each of which has a PathGlobs to represent its `fileset`."""
 
+  __slots__ = ('address', 'bundles', 'filespecs_list', 'path_globs_list')
+
+  def __init__(self, address, bundles, filespecs_list, path_globs_list):
+    self.address = address
+    self.bundles = bundles
+    self.filespecs_list = filespecs_list
+    self.path_globs_list = path_globs_list
+
   def __eq__(self, other):
     return type(self) == type(other) and self.address == other.address
 
@@ -157,6 +188,13 @@ class BundlesField(datatype('BundlesField', ['address', 'bundles', 'filespecs_li
   def __hash__(self):
     return hash(self.address)
 
+  def __repr__(self):
+    return str(self)
+
+  def __str__(self):
+    return ('BundlesField(address={}, bundles={!r}, filespecs_list={!r}, path_globs_list={!r})'
+            .format(self.address, self.bundles, self.filespecs_list, self.path_globs_list))
+
 
 class BundleAdaptor(Struct):
   """A Struct to capture the args for the `bundle` object.
@@ -181,29 +219,29 @@ class JvmAppAdaptor(TargetAdaptor):
     """The BundleAdaptors for this JvmApp."""
     return self.bundles
 
-  @property
-  def field_adaptors(self):
-    with exception_logging(logger, 'Exception in `field_adaptors` property'):
-      field_adaptors = super(JvmAppAdaptor, self).field_adaptors
-      if getattr(self, 'bundles', None) is None:
-        return field_adaptors
+  def _compute_field_adaptors(self):
+    field_adaptors = super(JvmAppAdaptor, self)._compute_field_adaptors()
+    if getattr(self, 'bundles', None) is None:
+      return field_adaptors
 
-      bundles_field = self._construct_bundles_field()
-      return field_adaptors + (bundles_field,)
+    bundles_field = self._construct_bundles_field()
+    return field_adaptors + (bundles_field,)
 
   def _construct_bundles_field(self):
-    filespecs_list = []
-    path_globs_list = []
-    for bundle in self.bundles:
+    bundles = self.bundles
+    spec_path = self.address.spec_path
+    from_sources_field = BaseGlobs.from_sources_field
+
+    filespecs_list = [None] * len(bundles)
+    path_globs_list = [None] * len(bundles)
+    for i, bundle in enumerate(bundles):
       # NB: if a bundle has a rel_path, then the rel_root of the resulting file globs must be
       # set to that rel_path.
-      rel_root = getattr(bundle, 'rel_path', self.address.spec_path)
-
-      base_globs = BaseGlobs.from_sources_field(bundle.fileset, rel_root)
-      path_globs = base_globs.to_path_globs(rel_root)
+      rel_root = getattr(bundle, 'rel_path', spec_path)
 
-      filespecs_list.append(base_globs.filespecs)
-      path_globs_list.append(path_globs)
+      base_globs = from_sources_field(bundle.fileset, rel_root)
+      filespecs_list[i] = base_globs.filespecs
+      path_globs_list[i] = base_globs.to_path_globs(rel_root)
     return BundlesField(self.address,
                         self.bundles,
                         filespecs_list,
@@ -221,19 +259,17 @@ class RemoteSourcesAdaptor(TargetAdaptor):
 
 
 class PythonTargetAdaptor(TargetAdaptor):
-  @property
-  def field_adaptors(self):
-    with exception_logging(logger, 'Exception in `field_adaptors` property'):
-      field_adaptors = super(PythonTargetAdaptor, self).field_adaptors
-      if getattr(self, 'resources', None) is None:
-        return field_adaptors
-      base_globs = BaseGlobs.from_sources_field(self.resources, self.address.spec_path)
-      path_globs = base_globs.to_path_globs(self.address.spec_path)
-      sources_field = SourcesField(self.address,
-                                   'resources',
-                                   base_globs.filespecs,
-                                   path_globs)
-      return field_adaptors + (sources_field,)
+  def _compute_field_adaptors(self):
+    field_adaptors = super(PythonTargetAdaptor, self)._compute_field_adaptors()
+    if getattr(self, 'resources', None) is None:
+      return field_adaptors
+    base_globs = BaseGlobs.from_sources_field(self.resources, self.address.spec_path)
+    path_globs = base_globs.to_path_globs(self.address.spec_path)
+    sources_field = SourcesField(self.address,
+                                 'resources',
+                                 base_globs.filespecs,
+                                 path_globs)
+    return field_adaptors + (sources_field,)
 
 
 class PythonLibraryAdaptor(PythonTargetAdaptor):
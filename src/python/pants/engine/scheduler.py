@@ -22,7 +22,7 @@ from pants.build_graph.address import Address, BuildFileAddress
 from pants.engine.addressable import SubclassesOf
 from pants.engine.fs import FileContent, FilesContent, Path, PathGlobs, Snapshot
 from pants.engine.isolated_process import _Snapshots, create_snapshot_rules
-from pants.engine.nodes import Return, Throw
+from pants.engine.nodes import Return, State, Throw
 from pants.engine.rules import RuleIndex, SingletonRule, TaskRule
 from pants.engine.selectors import (Select, SelectDependencies, SelectProjection, SelectTransitive,
                                     SelectVariant, constraint_for)
@@ -507,16 +507,22 @@ class LocalScheduler(object):
     if result.error:
       raise result.error
 
-    # State validation.
-    unknown_state_types = tuple(
-      type(state) for _, state in result.root_products if type(state) not in (Throw, Return)
-    )
+    # State validation, in a single pass over the roots: Return is by far the most common case.
+    unknown_state_types = []
+    throw_root_states = []
+    for _, state in result.root_products:
+      state_type = type(state)
+      if state_type is Return:
+        continue
+      elif state_type is Throw:
+        throw_root_states.append(state)
+      else:
+        unknown_state_types.append(state_type)
     if unknown_state_types:
-      State.raise_unrecognized(unknown_state_types)
+      State.raise_unrecognized(tuple(unknown_state_types))
 
     # Throw handling.
     # TODO: See https://github.com/pantsbuild/pants/issues/3912
-    throw_root_states = tuple(state for root, state in result.root_products if type(state) is Throw)
     if throw_root_states:
       if self._include_trace_on_error:
         cumulative_trace = '\n'.join(self.trace())
@@ -7,7 +7,8 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
 
 import unittest
 
-from pants.engine.legacy.structs import Files
+from pants.build_graph.address import Address
+from pants.engine.legacy.structs import Files, SourcesField, TargetAdaptor
 
 
 class StructTest(unittest.TestCase):
@@ -22,3 +23,18 @@ class StructTest(unittest.TestCase):
     with self.assertRaises(ValueError) as cm:
       Files(exclude='*.md', spec_path='')
     self.assertEqual('Excludes of type `unicode` are not supported: got "*.md"', str(cm.exception))
+
+  def test_field_adaptors_memoized(self):
+    adaptor = TargetAdaptor(address=Address('src/a', 'a'), sources=['a.py'])
+    field_adaptors = adaptor.field_adaptors
+    self.assertEqual(1, len(field_adaptors))
+    self.assertIs(field_adaptors, adaptor.field_adaptors)
+    self.assertNotIn('_field_adaptors', adaptor.kwargs())
+
+  def test_sources_field_eq_and_hash_by_address(self):
+    address = Address('src/a', 'a')
+    one = SourcesField(address, 'sources', {'globs': ['a.py']}, None)
+    two = SourcesField(address, 'sources', {'globs': ['b.py']}, None)
+    self.assertEqual(one, two)
+    self.assertEqual(hash(address), hash(one))
+    self.assertNotEqual(one, SourcesField(address, 'resources', {'globs': ['a.py']}, None))
@@ -9,11 +9,14 @@ import os
 import unittest
 from textwrap import dedent
 
+import mock
+
 from pants.base.cmd_line_spec_parser import CmdLineSpecParser
 from pants.build_graph.address import Address
 from pants.engine.addressable import BuildFileAddresses
 from pants.engine.nodes import Return, Throw
 from pants.engine.rules import RootRule, TaskRule
+from pants.engine.scheduler import ExecutionResult
 from pants.engine.selectors import Select, SelectVariant
 from pants.util.contextutil import temporary_dir
 from pants_test.engine.examples.planners import (ApacheThriftJavaConfiguration, Classpath, GenGoal,
@@ -77,6 +80,20 @@ class SchedulerTest(unittest.TestCase):
     root, = self.build(build_request)
     self.assert_root(root, self.guava, Classpath(creator='ivy_resolve'))
 
+  def test_products_request_unrecognized_state(self):
+    class UnrecognizedState(object):
+      pass
+
+    root_products = [((self.guava, Classpath), Return(Classpath(creator='ivy_resolve'))),
+                     ((self.java, Classpath), UnrecognizedState())]
+    with mock.patch.object(self.scheduler, 'execution_request'), \
+         mock.patch.object(self.scheduler, 'execute',
+                           return_value=ExecutionResult.finished(root_products)):
+      with self.assertRaises(ValueError) as cm:
+        self.scheduler.products_request([Classpath], [self.guava, self.java])
+    self.assertIn('Unrecognized Node State', str(cm.exception))
+    self.assertIn('UnrecognizedState', str(cm.exception))
+
   @unittest.skip('Skipped to expedite landing #3821; see: #4027.')
   def test_compile_only_3rdparty_internal(self):
     build_request = self.request(['compile'], '3rdparty/jvm:guava')